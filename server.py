@@ -3,10 +3,11 @@
 #   /                      -> static/index.html
 #   /static/*              -> static assets
 #   /api/search            -> PubMed search with filters
-#   /api/abstract/{pmid}   -> Robust abstract retrieval (XML → text; HTML fallback)
+#   /api/abstract/{pmid}   -> Robust abstract retrieval (XML → text → HTML, fallbacks hedged)
 #   /api/summarize         -> Optional abstractive summarizer (fallback to first sentences)
 #   /api/translate         -> GoogleTranslator wrapper with graceful fallback
-#   /api/reputation/{pmid} -> Real reputation proxy using PubMed (DOI), OpenAlex & Crossref
+#   /api/reputation/{pmid} -> Reputation proxy from PubMed signals (citations, OA, recency, activity)
+#   /api/reputation_bulk   -> Same, for a list of PMIDs in one batched ESummary/ELink round
 #
 # Notes:
 # - Network calls are capped with timeouts and heavy failure-guarding.
@@ -14,24 +15,34 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import functools
+import logging
 import os
 import re
-from typing import Dict, List, Optional, Tuple
+import threading
+import time
+from typing import Dict, List, Optional, Set, Tuple
 
-import requests
-from fastapi import Body, FastAPI, Query
+import httpx
+from cachetools import TTLCache
+from fastapi import Body, FastAPI, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from deep_translator import GoogleTranslator
-import xml.etree.ElementTree as ET
-from bs4 import BeautifulSoup
+import lxml.etree as LET
+from selectolax.lexbor import LexborHTMLParser
+
+logger = logging.getLogger(__name__)
 
 # On some Windows setups, huggingface_hub tries to use hf_xet fast-path; disable it.
 os.environ.setdefault("HF_HUB_ENABLE_HF_XET", "0")
 
 # Optional transformers (summarizer); loaded lazily.
 _SUMMARIZER = None
+_SUMMARIZER_LOCK = threading.Lock()
 _TRANSFORMERS_OK = False
 try:
     from transformers import pipeline  # type: ignore
@@ -44,9 +55,29 @@ except Exception:
 # ------------------------------------------------------------------------------
 
 NCBI_EUTILS = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
+NCBI_TOOL = "spacebio-ke"
+NCBI_EMAIL = os.environ.get("PUBMED_EMAIL", "").strip()
+NCBI_API_KEY = os.environ.get("NCBI_API_KEY", "").strip()
+# Requests/second this process may send. E-utilities allows 3 per client (10 with a key);
+# with N workers, set NCBI_RATE to that limit divided by N.
+NCBI_RATE = float(os.environ.get("NCBI_RATE", "10" if NCBI_API_KEY else "3"))
+NCBI_CONCURRENCY = int(os.environ.get("NCBI_CONCURRENCY", str(max(1, int(NCBI_RATE)))))
+NCBI_RETRIES = 3  # extra attempts after a 429, with exponential backoff
+NCBI_BACKOFF = 0.5  # seconds before the first retry; doubles each time
 HEADERS = {"User-Agent": "SpaceBiologyKnowledgeEngine/1.0"}
 REQUEST_TIMEOUT = 12  # seconds
 RETMAX = 25
+ABSTRACT_HEDGE_DELAY = 1.0  # seconds XML efetch runs alone before fallbacks start
+SUMMARIZER_MODEL = "sshleifer/distilbart-cnn-12-6"  # small distilled BART
+
+# Abstracts and reputation per PMID change on the scale of days.
+CACHE_MAXSIZE = 10_000
+CACHE_TTL = 86400  # seconds
+CACHE_CONTROL = "public, max-age=3600"
+
+# PMIDs per /api/reputation_bulk call: one search page. Each PMID can add two ESearch
+# counts, all paced through the shared NCBI limit, so keep batches small.
+REPUTATION_BULK_MAX = RETMAX
 
 STATIC_DIR = os.path.abspath("static")
 OUTPUT_DIR = os.path.abspath("outputs")
@@ -57,7 +88,7 @@ os.makedirs(OUTPUT_DIR, exist_ok=True)
 # App
 # ------------------------------------------------------------------------------
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"], allow_credentials=True,
@@ -66,16 +97,127 @@ app.add_middleware(
 
 app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
 
+# One pooled async client (keep-alive + HTTP/2) for all outbound calls, stored on
+# app.state.http. retries=1 covers transient connect/DNS/TLS failures only.
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=100)
+
+
+@app.on_event("startup")
+async def _open_http_client():
+    app.state.http = httpx.AsyncClient(
+        headers=HEADERS,
+        timeout=REQUEST_TIMEOUT,
+        follow_redirects=True,
+        transport=httpx.AsyncHTTPTransport(http2=True, limits=HTTP_LIMITS, retries=1),
+    )
+
+
+@app.on_event("shutdown")
+async def _close_http_client():
+    await app.state.http.aclose()
+
+
+# ------------------------------------------------------------------------------
+# Cache (in-process TTL + LRU for PMID-keyed lookups)
+# ------------------------------------------------------------------------------
+
+def _ttl_cached(fn):
+    """Memoize an async lookup by its positional args. Empty results are not
+    cached, so a failed upstream call is retried on the next request."""
+    cache: TTLCache = TTLCache(maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL)
+
+    @functools.wraps(fn)
+    async def wrapper(*args):
+        try:
+            return cache[args]
+        except KeyError:
+            pass
+        value = await fn(*args)
+        if value:
+            cache[args] = value
+        return value
+
+    wrapper.cache = cache  # type: ignore[attr-defined]
+    return wrapper
 
-@app.get("/")
-def root():
-    return FileResponse(os.path.join(STATIC_DIR, "index.html"))
+
+# ------------------------------------------------------------------------------
+# NCBI E-utilities access (bounded concurrency, paced to the rate limit)
+# ------------------------------------------------------------------------------
+
+_NCBI_SEM = asyncio.Semaphore(NCBI_CONCURRENCY)
+_NCBI_NEXT_SLOT = 0.0
+
+
+async def _ncbi_pace() -> None:
+    """Start E-utilities requests at most NCBI_RATE per second (per process).
+
+    A slot is claimed only once it is due, so a task cancelled while waiting
+    (e.g. a losing abstract strategy) does not use up anyone's slot.
+    """
+    global _NCBI_NEXT_SLOT
+    while True:
+        now = time.monotonic()
+        if now >= _NCBI_NEXT_SLOT:
+            _NCBI_NEXT_SLOT = now + 1.0 / NCBI_RATE
+            return
+        await asyncio.sleep(_NCBI_NEXT_SLOT - now)
+
+
+def _ncbi_params(params: dict) -> dict:
+    # Include tool (and optional email / API key) to be a good API citizen
+    extra = {"tool": NCBI_TOOL}
+    if NCBI_EMAIL:
+        extra["email"] = NCBI_EMAIL
+    if NCBI_API_KEY:
+        extra["api_key"] = NCBI_API_KEY
+    return {**params, **extra}
+
+
+async def _ncbi_get(url: str, params: dict) -> httpx.Response:
+    """GET an E-utilities endpoint; a 429 is retried with exponential backoff."""
+    params = _ncbi_params(params)
+    for attempt in range(NCBI_RETRIES + 1):
+        async with _NCBI_SEM:
+            await _ncbi_pace()
+            r = await app.state.http.get(url, params=params)
+        if r.status_code != 429 or attempt == NCBI_RETRIES:
+            break
+        await asyncio.sleep(NCBI_BACKOFF * 2 ** attempt)
+    return r
+
+
+@contextlib.asynccontextmanager
+async def _ncbi_stream(url: str, params: dict):
+    """Streaming GET against E-utilities; holds a concurrency slot until the body is done.
+    A 429 is retried with the same backoff as _ncbi_get."""
+    params = _ncbi_params(params)
+    for attempt in range(NCBI_RETRIES + 1):
+        async with _NCBI_SEM:
+            await _ncbi_pace()
+            async with app.state.http.stream("GET", url, params=params) as resp:
+                if resp.status_code != 429 or attempt == NCBI_RETRIES:
+                    yield resp
+                    return
+        await asyncio.sleep(NCBI_BACKOFF * 2 ** attempt)
 
 
 # ------------------------------------------------------------------------------
 # Summarizer (lazy)
 # ------------------------------------------------------------------------------
 
+_SENT_SPLIT = re.compile(r"(?<=[.!?])\s+")
+
+
+def _summarizer_device() -> int:
+    """First CUDA device if torch sees one, else CPU (-1)."""
+    try:
+        import torch  # type: ignore
+        return 0 if torch.cuda.is_available() else -1
+    except Exception:
+        return -1
+
+
 def _get_summarizer():
     """Load a default summarization pipeline if transformers are present."""
     global _SUMMARIZER
@@ -85,17 +227,27 @@ def _get_summarizer():
         if not _TRANSFORMERS_OK:
             _SUMMARIZER = False
             return None
-        try:
-            _SUMMARIZER = pipeline("summarization")  # default small model
-        except Exception:
-            _SUMMARIZER = False
-            return None
-    return _SUMMARIZER
+        # The startup warm-up and a first request may race here; load only once.
+        with _SUMMARIZER_LOCK:
+            if _SUMMARIZER is None:
+                try:
+                    _SUMMARIZER = pipeline("summarization", model=SUMMARIZER_MODEL, device=_summarizer_device())
+                except Exception:
+                    _SUMMARIZER = False
+    return _SUMMARIZER or None
+
+
+@app.on_event("startup")
+async def _warm_summarizer():
+    # Load the model off the event loop so the first /api/summarize is already warm.
+    app.state.summarizer_warmup = asyncio.create_task(asyncio.to_thread(_get_summarizer))
 
 
 def _split_for_summary(text: str, max_chars: int = 1800) -> List[str]:
     """Chunk text into reasonably sized pieces for small summarizers."""
-    sents = re.split(r"(?<=[.!?])\s+", text)
+    if len(text) <= max_chars:
+        return [text]
+    sents = _SENT_SPLIT.split(text)
     out, buf = [], ""
     for s in sents:
         if len(s) > max_chars:
@@ -125,15 +277,16 @@ def api_summarize(payload: Dict = Body(...)):
     sm = _get_summarizer()
     if sm is None:
         # Fallback: first 3 sentences
-        parts = re.split(r"(?<=[.!?])\s+", text)
+        parts = _SENT_SPLIT.split(text)
         return {"summary": " ".join(parts[:3]).strip()}
     chunks = _split_for_summary(text)
     try:
-        pieces = [sm(c, max_length=150, min_length=50, do_sample=False)[0]["summary_text"]
-                  for c in chunks]
+        # One batched call instead of one pipeline call per chunk.
+        outs = sm(chunks, max_length=150, min_length=50, do_sample=False, batch_size=len(chunks))
+        pieces = [o["summary_text"] for o in outs]
         return {"summary": "\n".join(pieces)}
     except Exception:
-        parts = re.split(r"(?<=[.!?])\s+", text)
+        parts = _SENT_SPLIT.split(text)
         return {"summary": " ".join(parts[:3]).strip()}
 
 
@@ -141,25 +294,113 @@ def api_summarize(payload: Dict = Body(...)):
 # Translate
 # ------------------------------------------------------------------------------
 
+_TRANSLATORS = threading.local()
+
+
+def _translator(lang: str) -> GoogleTranslator:
+    """Reuse one GoogleTranslator per target language per worker thread.
+
+    An instance keeps the text being translated on self while its request is in
+    flight, so it is cached per thread rather than shared process-wide.
+    """
+    by_lang = getattr(_TRANSLATORS, "by_lang", None)
+    if by_lang is None:
+        by_lang = _TRANSLATORS.by_lang = {}
+    tr = by_lang.get(lang)
+    if tr is None:
+        tr = by_lang[lang] = GoogleTranslator(source="auto", target=lang)
+    return tr
+
+
+def _translate_one(text: str, lang: str) -> str:
+    return _translator(lang).translate(text)
+
+
 @app.post("/api/translate")
-def api_translate(payload: Dict = Body(...)):
+async def api_translate(payload: Dict = Body(...)):
     texts = payload.get("texts", [])
     lang = payload.get("lang", "en")
-    out = []
-    for t in texts:
-        try:
-            out.append(GoogleTranslator(source="auto", target=lang).translate(t))
-        except Exception:
-            out.append(t)
-    return {"translations": out}
+    # GoogleTranslator is blocking; run the texts side by side in worker threads.
+    results = await asyncio.gather(
+        *[asyncio.to_thread(_translate_one, t, lang) for t in texts],
+        return_exceptions=True,
+    )
+    # Any failure (bad language, network, quota) falls back to the original text.
+    return {"translations": [t if isinstance(res, BaseException) else res for t, res in zip(texts, results)]}
 
 
 # ------------------------------------------------------------------------------
 # Search (PubMed E-utilities)
 # ------------------------------------------------------------------------------
 
+# Filter option (as sent by the UI) -> PubMed term token.
+
+# Text availability
+_TA_MAP = {
+    "Abstract": "hasabstract[text]",
+    "Free full text": "free full text[filter]",
+    "Full text": "full text[filter]",
+}
+
+# Article attributes (designs)
+_ATTR_MAP = {
+    "Systematic Review": "systematic[sb]",
+    "Clinical Trial": "clinicaltrial[pt]",
+    "Randomized Controlled Trial": "randomized controlled trial[pt]",
+    "Review": "review[pt]",
+    "Meta-Analysis": "meta-analysis[pt]",
+    "Case Reports": "case reports[pt]",
+}
+
+# Article type (publication type)
+_TYPE_MAP = {
+    "Journal Article": "Journal Article[pt]",
+    "Letter": "Letter[pt]",
+    "Editorial": "Editorial[pt]",
+    "Guideline": "Guideline[pt]",
+    "Dataset": "Data Set[pt]",
+    "Data Set": "Data Set[pt]",
+}
+
+# Language
+_LANG_MAP = {
+    name: f"{name.lower()}[lang]"
+    for name in (
+        "English", "Spanish", "French", "German", "Italian", "Portuguese", "Russian",
+        "Chinese", "Japanese", "Persian", "Arabic", "Hindi", "Turkish", "Korean",
+    )
+}
+
+# Species (MeSH)
+_SPECIES_MAP = {
+    "Humans": "Humans[MeSH Terms]",
+    "Animals": "(Animals[MeSH Terms] NOT Humans[MeSH Terms])",
+}
+
+# Sex (MeSH)
+_SEX_MAP = {
+    "Male": "Male[MeSH Terms]",
+    "Female": "Female[MeSH Terms]",
+}
+
+# Age (MeSH)
+_AGE_MAP = {
+    "Child": "Child[MeSH Terms]",
+    "Adolescent": "Adolescent[MeSH Terms]",
+    "Adult": "Adult[MeSH Terms]",
+    "Middle Aged": "Middle Aged[MeSH Terms]",
+    "Aged": "Aged[MeSH Terms]",
+}
+
+# Other (publication type)
+_OTHER_MAP = {
+    "Preprint": "Preprint[pt]",
+    "Retracted": "Retracted Publication[pt]",
+}
+
+
 @app.get("/api/search")
-def api_search(
+async def api_search(
     query: str = Query(...),
     start_year: int = Query(2000),
     end_year: int = Query(2025),
@@ -182,237 +423,43 @@ def api_search(
         tokens.append(f"({query})")
 
     # Publication date range (canonical form)
-    date_token = f'("{start_year}"[dp] : "{end_year}"[dp])'
-    tokens.append(date_token)
-
-    # Text availability
-    ta_map = {
-        "Abstract": "hasabstract[text]",
-        "Free full text": "free full text[filter]",
-        "Full text": "full text[filter]",
-    }
-    if text_availability in ta_map:
-        tokens.append(ta_map[text_availability])
-
-    # Article attributes (designs)
-    attr_map = {
-        "Systematic Review": "systematic[sb]",
-        "Clinical Trial": "clinicaltrial[pt]",
-        "Randomized Controlled Trial": "randomized controlled trial[pt]",
-        "Review": "review[pt]",
-        "Meta-Analysis": "meta-analysis[pt]",
-        "Case Reports": "case reports[pt]",
-    }
-    if article_attribute in attr_map:
-        tokens.append(attr_map[article_attribute])
-
-    # Article type (publication type)
-    type_map = {
-        "Journal Article": "Journal Article[pt]",
-        "Letter": "Letter[pt]",
-        "Editorial": "Editorial[pt]",
-        "Guideline": "Guideline[pt]",
-        "Dataset": "Data Set[pt]",
-        "Data Set": "Data Set[pt]",
-    }
-    if article_type in type_map:
-        tokens.append(type_map[article_type])
-
-    # Language
-    lang_map = {
-        "English": "english", "Spanish": "spanish", "French": "french", "German": "german",
-        "Italian": "italian", "Portuguese": "portuguese", "Russian": "russian", "Chinese": "chinese",
-        "Japanese": "japanese", "Persian": "persian", "Arabic": "arabic", "Hindi": "hindi",
-        "Turkish": "turkish", "Korean": "korean",
-    }
-    if language in lang_map:
-        tokens.append(f"{lang_map[language]}[lang]")
-
-    # Species
-    if species == "Humans":
-        tokens.append("Humans[MeSH Terms]")
-    elif species == "Animals":
-        tokens.append("(Animals[MeSH Terms] NOT Humans[MeSH Terms])")
-
-    # Sex
-    if sex == "Male":
-        tokens.append("Male[MeSH Terms]")
-    elif sex == "Female":
-        tokens.append("Female[MeSH Terms]")
-
-    # Age
-    age_map = {
-        "Child": "Child[MeSH Terms]",
-        "Adolescent": "Adolescent[MeSH Terms]",
-        "Adult": "Adult[MeSH Terms]",
-        "Middle Aged": "Middle Aged[MeSH Terms]",
-        "Aged": "Aged[MeSH Terms]",
-    }
-    if age in age_map:
-        tokens.append(age_map[age])
-
-    # Other
-    other_map = {
-        "Preprint": "Preprint[pt]",
-        "Retracted": "Retracted Publication[pt]",
-    }
-    if other in other_map:
-        tokens.append(other_map[other])
-
-    term = " AND ".join([t for t in tokens if t])
-
-    # Include tool (and optional email) to be a good API citizen
-    tool_params = {"tool": "spacebio-ke"}
-    pubmed_email = os.environ.get("PUBMED_EMAIL", "").strip()
-    if pubmed_email:
-        tool_params["email"] = pubmed_email
+    tokens.append(f'("{start_year}"[dp] : "{end_year}"[dp])')
+
+    # Filters, in PubMed term order; unknown / "Any" / "None" values add nothing.
+    for value, token_map in (
+        (text_availability, _TA_MAP),
+        (article_attribute, _ATTR_MAP),
+        (article_type, _TYPE_MAP),
+        (language, _LANG_MAP),
+        (species, _SPECIES_MAP),
+        (sex, _SEX_MAP),
+        (age, _AGE_MAP),
+        (other, _OTHER_MAP),
+    ):
+        token = token_map.get(value)
+        if token:
+            tokens.append(token)
+
+    # Every append above is already guarded, so tokens holds no empty strings.
+    term = " AND ".join(tokens)
 
     # ESearch
     try:
-        r = requests.get(
-            f"{NCBI_EUTILS}/esearch.fcgi",
-            params={"db": "pubmed", "term": term, "retmax": RETMAX, "retmode": "json", "sort": "relevance", **tool_params},
-            headers=HEADERS, timeout=REQUEST_TIMEOUT,
-        )
-        r.raise_for_status()
-        ids = r.json().get("esearchresult", {}).get("idlist", [])
-    except Exception:
-        return {"results": [], "term": term}
-
-    results = []
-    if ids:
-        try:
-            r2 = requests.get(
-                f"{NCBI_EUTILS}/esummary.fcgi",
-                params={"db": "pubmed", "id": ",".join(ids), "retmode": "json", **tool_params},
-                headers=HEADERS, timeout=REQUEST_TIMEOUT,
-            )
-            r2.raise_for_status()
-            summ = r2.json().get("result", {})
-        except Exception:
-            summ = {}
-
-        for pmid in ids:
-            it = summ.get(pmid, {})
-            results.append({
-                "pmid": pmid,
-                "title": it.get("title"),
-                "journal": it.get("fulljournalname"),
-                "year": (it.get("pubdate") or "").split(" ")[0],
-                "authors": ", ".join([a.get("name") for a in it.get("authors", [])][:5]),
-            })
-
-    return {"results": results, "term": term}
-
-    # Publication date range
-    tokens.append(f"({start_year}:{end_year})[dp]")
-
-    # Text availability
-    ta_map = {
-        "Abstract": "hasabstract[text]",
-        "Free full text": "free full text[filter]",
-        "Full text": "full text[filter]",
-    }
-    if text_availability in ta_map:
-        tokens.append(ta_map[text_availability])
-
-    # Article attributes (designs)
-    attr_map = {
-        "Systematic Review": "systematic[sb]",
-        "Clinical Trial": "clinicaltrial[pt]",
-        "Randomized Controlled Trial": "randomized controlled trial[pt]",
-        "Review": "review[pt]",
-        "Meta-Analysis": "meta-analysis[pt]",
-        "Case Reports": "case reports[pt]",
-    }
-    if article_attribute in attr_map:
-        tokens.append(attr_map[article_attribute])
-
-    # Article type (publication type)
-    type_map = {
-        "Journal Article": "Journal Article[pt]",
-        "Letter": "Letter[pt]",
-        "Editorial": "Editorial[pt]",
-        "Guideline": "Guideline[pt]",
-        "Dataset": "Data Set[pt]",
-        "Data Set": "Data Set[pt]",
-    }
-    if article_type in type_map:
-        tokens.append(type_map[article_type])
-
-    # Language
-    lang_map = {
-        "English": "english",
-        "Spanish": "spanish",
-        "French": "french",
-        "German": "german",
-        "Italian": "italian",
-        "Portuguese": "portuguese",
-        "Russian": "russian",
-        "Chinese": "chinese",
-        "Japanese": "japanese",
-        "Persian": "persian",
-        "Arabic": "arabic",
-        "Hindi": "hindi",
-        "Turkish": "turkish",
-        "Korean": "korean",
-    }
-    if language in lang_map:
-        tokens.append(f"{lang_map[language]}[lang]")
-
-    # Species (MeSH)
-    if species == "Humans":
-        tokens.append("Humans[MeSH Terms]")
-    elif species == "Animals":
-        tokens.append("(Animals[MeSH Terms] NOT Humans[MeSH Terms])")
-
-    # Sex (MeSH)
-    if sex == "Male":
-        tokens.append("Male[MeSH Terms]")
-    elif sex == "Female":
-        tokens.append("Female[MeSH Terms]")
-
-    # Age (MeSH)
-    age_map = {
-        "Child": "Child[MeSH Terms]",
-        "Adolescent": "Adolescent[MeSH Terms]",
-        "Adult": "Adult[MeSH Terms]",
-        "Middle Aged": "Middle Aged[MeSH Terms]",
-        "Aged": "Aged[MeSH Terms]",
-    }
-    if age in age_map:
-        tokens.append(age_map[age])
-
-    # Other (publication type)
-    other_map = {
-        "Preprint": "Preprint[pt]",
-        "Retracted": "Retracted Publication[pt]",
-    }
-    if other in other_map:
-        tokens.append(other_map[other])
-
-    term = " AND ".join([t for t in tokens if t])
-
-    # ESearch → ids
-    try:
-        r = requests.get(
+        r = await _ncbi_get(
             f"{NCBI_EUTILS}/esearch.fcgi",
             params={"db": "pubmed", "term": term, "retmax": RETMAX, "retmode": "json", "sort": "relevance"},
-            headers=HEADERS, timeout=REQUEST_TIMEOUT,
         )
         r.raise_for_status()
+        ids = r.json().get("esearchresult", {}).get("idlist", [])
     except Exception:
         return {"results": [], "term": term}
 
-    ids = r.json().get("esearchresult", {}).get("idlist", [])
-
     results = []
     if ids:
         try:
-            r2 = requests.get(
+            r2 = await _ncbi_get(
                 f"{NCBI_EUTILS}/esummary.fcgi",
                 params={"db": "pubmed", "id": ",".join(ids), "retmode": "json"},
-                headers=HEADERS, timeout=REQUEST_TIMEOUT,
             )
             r2.raise_for_status()
             summ = r2.json().get("result", {})
@@ -436,44 +483,74 @@ def api_search(
 # Abstract retrieval (XML → text; text fallback; HTML scrape)
 # ------------------------------------------------------------------------------
 
-def _extract_abstract_from_xml(xml_text: str) -> str:
-    try:
-        root = ET.fromstring(xml_text)
-    except Exception:
-        return ""
+def _new_abstract_parser() -> "LET.XMLPullParser":
+    return LET.XMLPullParser(events=("end",), tag=("AbstractText", "Abstract", "MedlineCitation"))
 
-    pieces: List[str] = []
-    for node in root.findall(".//Abstract/AbstractText"):
-        label = node.attrib.get("Label") or node.attrib.get("NlmCategory")
-        txt = "".join(node.itertext()).strip()
-        if not txt:
+
+def _drain_abstract_events(parser: "LET.XMLPullParser", pieces: List[str], other: List[str]) -> bool:
+    """Collect AbstractText from parsed events; True once nothing better can follow.
+
+    Abstract precedes OtherAbstract in PubMed XML, so a closed Abstract with text
+    ends the search. Otherwise every OtherAbstract (often one per language) is
+    collected until the enclosing MedlineCitation closes.
+    """
+    for _, node in parser.read_events():
+        if node.tag == "Abstract" and pieces:
+            return True
+        if node.tag == "MedlineCitation":
+            return True
+        if node.tag != "AbstractText":
             continue
-        pieces.append(f"{label}: {txt}" if label else txt)
+        parent = node.getparent()
+        where = parent.tag if parent is not None else ""
+        txt = "".join(node.itertext()).strip()
+        if txt and where == "Abstract":
+            label = node.get("Label") or node.get("NlmCategory")
+            pieces.append(f"{label}: {txt}" if label else txt)
+        elif txt and where == "OtherAbstract":
+            other.append(txt)
+        node.clear()
+    return False
+
 
+def _join_abstract(pieces: List[str], other: List[str]) -> str:
     if pieces:
         return "\n\n".join(pieces).strip()
-
-    other = ["".join(n.itertext()).strip() for n in root.findall(".//OtherAbstract/AbstractText")]
-    other = [t for t in other if t]
     if other:
         return "\n\n".join(other).strip()
-
     return ""
 
 
+async def _fetch_abstract_xml(pmid: str) -> str:
+    """efetch XML fed incrementally into lxml; stops reading once the abstract has closed."""
+    pieces: List[str] = []
+    other: List[str] = []
+    try:
+        parser = _new_abstract_parser()
+        async with _ncbi_stream(
+            f"{NCBI_EUTILS}/efetch.fcgi",
+            params={"db": "pubmed", "id": pmid, "retmode": "xml"},
+        ) as resp:
+            resp.raise_for_status()
+            async for chunk in resp.aiter_bytes():
+                parser.feed(chunk)
+                if _drain_abstract_events(parser, pieces, other):
+                    break
+    except Exception:
+        pass
+    return _join_abstract(pieces, other)
+
+
 def _extract_abstract_from_html(html_text: str) -> str:
     try:
-        soup = BeautifulSoup(html_text, "html.parser")
+        tree = LexborHTMLParser(html_text)
     except Exception:
         return ""
-    for tag, attrs in [
-        ("div", {"class": "abstract"}),
-        ("div", {"class": "abstract-content"}),
-        ("section", {"id": "abstract"}),
-    ]:
-        node = soup.find(tag, attrs=attrs)
+    # Checked in order of preference, not document order.
+    for selector in ("div.abstract", "div.abstract-content", "section#abstract"):
+        node = tree.css_first(selector)
         if node:
-            text = node.get_text("\n", strip=True)
+            text = node.text(separator="\n", strip=True)
             lines = [ln for ln in text.splitlines() if ln.strip()]
             if lines and lines[0].lower().startswith("abstract"):
                 lines = lines[1:]
@@ -481,257 +558,130 @@ def _extract_abstract_from_html(html_text: str) -> str:
     return ""
 
 
-@app.get("/api/abstract/{pmid}")
-def api_abstract(pmid: str):
-    # XML (best)
-    try:
-        r = requests.get(
-            f"{NCBI_EUTILS}/efetch.fcgi",
-            params={"db": "pubmed", "id": pmid, "retmode": "xml"},
-            headers=HEADERS, timeout=REQUEST_TIMEOUT,
-        )
-        r.raise_for_status()
-        text = _extract_abstract_from_xml(r.text)
-        if text:
-            return {"abstract": text}
-    except Exception:
-        pass
-
-    # Plain text
+async def _fetch_abstract_text(pmid: str) -> str:
     try:
-        r2 = requests.get(
+        r = await _ncbi_get(
             f"{NCBI_EUTILS}/efetch.fcgi",
             params={"db": "pubmed", "id": pmid, "rettype": "abstract", "retmode": "text"},
-            headers=HEADERS, timeout=REQUEST_TIMEOUT,
         )
-        if r2.status_code == 200:
-            plain = (r2.text or "").replace("\r", "").strip()
-            if plain:
-                return {"abstract": plain}
+        if r.status_code == 200:
+            return (r.text or "").replace("\r", "").strip()
     except Exception:
         pass
+    return ""
+
 
-    # HTML scrape (last resort)
+async def _fetch_abstract_html(pmid: str) -> str:
     try:
-        page = requests.get(f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/", headers=HEADERS, timeout=REQUEST_TIMEOUT)
+        page = await app.state.http.get(f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/")
         if page.status_code == 200:
-            html_abs = _extract_abstract_from_html(page.text)
-            if html_abs:
-                return {"abstract": html_abs}
+            return _extract_abstract_from_html(page.text)
     except Exception:
         pass
+    return ""
 
-    return {"abstract": ""}
 
+@_ttl_cached
+async def _fetch_abstract(pmid: str) -> str:
+    # XML (best) → plain text → HTML scrape (last resort). XML runs alone first; the
+    # fallbacks are started only if it comes back empty or is still pending after
+    # ABSTRACT_HEDGE_DELAY, so the common case costs one upstream call. Results are
+    # taken in preference order: a fallback is used only once every better one is empty.
+    xml = asyncio.create_task(_fetch_abstract_xml(pmid))
+    tasks = [xml]
+    try:
+        done, _ = await asyncio.wait({xml}, timeout=ABSTRACT_HEDGE_DELAY)
+        if xml in done and xml.result():
+            return xml.result()
+        tasks.append(asyncio.create_task(_fetch_abstract_text(pmid)))
+        tasks.append(asyncio.create_task(_fetch_abstract_html(pmid)))
+        for task in tasks:
+            text = await task
+            if text:
+                return text
+        return ""
+    finally:
+        for task in tasks:
+            task.cancel()
 
-# ------------------------------------------------------------------------------
-# Reputation (pragmatic proxy from public signals)
-# ------------------------------------------------------------------------------
 
-def _get_esummary(pmid: str) -> dict:
-    try:
-        r = requests.get(
-            f"{NCBI_EUTILS}/esummary.fcgi",
-            params={"db": "pubmed", "id": pmid, "retmode": "json"},
-            headers=HEADERS, timeout=REQUEST_TIMEOUT,
-        )
-        r.raise_for_status()
-        return r.json().get("result", {}).get(pmid, {}) or {}
-    except Exception:
-        return {}
+@app.get("/api/abstract/{pmid}")
+async def api_abstract(pmid: str, response: Response):
+    text = await _fetch_abstract(pmid)
+    if text:
+        response.headers["Cache-Control"] = CACHE_CONTROL
+    return {"abstract": text}
 
 
-def _extract_first_doi(esum: dict) -> Optional[str]:
-    # ESummary may return articleids with multiple types (doi, pii, pmc, …).
-    for aid in (esum.get("articleids") or []):
-        if aid.get("idtype") == "doi" and aid.get("value"):
-            return str(aid["value"]).strip()
-    # Some records store DOI in elocationid
-    eloc = (esum.get("elocationid") or "").strip()
-    if eloc and eloc.lower().startswith("doi:"):
-        return eloc.split(":", 1)[1].strip()
-    return None
+# ------------------------------------------------------------------------------
+# Reputation (pragmatic proxy from public signals)
+# ------------------------------------------------------------------------------
 
+_PMID_RE = re.compile(r"\d{1,10}")
 
-def _openalex_work_by_doi(doi: str) -> dict:
-    try:
-        r = requests.get(
-            f"https://api.openalex.org/works/doi:{doi}",
-            headers=HEADERS, timeout=REQUEST_TIMEOUT,
-        )
-        if r.status_code == 200:
-            return r.json()
-    except Exception:
-        pass
-    return {}
+# PMID -> reputation dict; filled only when every upstream call for that PMID succeeded.
+_REPUTATION_CACHE: TTLCache = TTLCache(maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL)
 
 
-def _openalex_venue_by_issn_or_name(issn: Optional[str], journal_name: Optional[str]) -> dict:
-    # Prefer ISSN if available; otherwise fallback to a name search.
-    if issn:
-        try:
-            r = requests.get(
-                f"https://api.openalex.org/venues",
-                params={"search": issn},
-                headers=HEADERS, timeout=REQUEST_TIMEOUT,
-            )
-            if r.status_code == 200:
-                data = r.json()
-                if data.get("results"):
-                    return data["results"][0]
-        except Exception:
-            pass
-    if journal_name:
-        try:
-            r = requests.get(
-                f"https://api.openalex.org/venues",
-                params={"search": journal_name},
-                headers=HEADERS, timeout=REQUEST_TIMEOUT,
-            )
-            if r.status_code == 200:
-                data = r.json()
-                if data.get("results"):
-                    return data["results"][0]
-        except Exception:
-            pass
-    return {}
+def _scale_cap_linear(x, cap) -> int:
+    x = max(0, int(x))
+    return min(100, int(round((min(x, cap) / cap) * 100)))
 
 
-def _crossref_type(doi: str) -> Optional[str]:
+def _reputation_fields(res: dict) -> Tuple[str, Optional[int], Optional[str], bool]:
+    """Journal title, publication year, first author and PMCID presence from one ESummary record."""
+    journal_title = res.get("fulljournalname") or res.get("source") or ""
+    pubdate = (res.get("pubdate") or "").split(" ")[0]
     try:
-        r = requests.get(f"https://api.crossref.org/works/{doi}", headers=HEADERS, timeout=REQUEST_TIMEOUT)
-        if r.status_code == 200:
-            return (r.json().get("message") or {}).get("type")
+        pub_year = int(pubdate[:4])
     except Exception:
-        pass
-    return None
-
-
-def _scale(value: float, lo: float, hi: float) -> int:
-    if hi <= lo:
-        return 0
-    pct = (value - lo) / (hi - lo)
-    pct = max(0.0, min(1.0, pct))
-    return int(round(pct * 100))
-
-
-@app.get("/api/reputation/{pmid}")
-def api_reputation(pmid: str):
-    """
-    Practical 'reputation' based on data we can obtain from PubMed:
-    - Citations: count of PubMed papers that cite this PMID (ELink citedin)
-    - Open Access: PMCID presence (100 if present else 30)
-    - Recency: years since publication -> decays with time
-    - Journal Activity: articles published by this journal in the last 5 years
-    - Author Activity: rough publication count for the first author
-
-    Returns components + total + level.
-    """
-    tool_params = {"tool": "spacebio-ke"}
-    pubmed_email = os.environ.get("PUBMED_EMAIL", "").strip()
-    if pubmed_email:
-        tool_params["email"] = pubmed_email
-
-    journal_title = ""
-    pub_year = None
+        pub_year = None
     first_author = None
+    auths = res.get("authors") or []
+    if auths:
+        # Use "LastName Initials" if present
+        ln = (auths[0].get("lastname") or "").strip()
+        ini = (auths[0].get("initials") or "").strip()
+        if ln:
+            first_author = f'{ln} {ini}'.strip()
+    # PMCID check
     pmcid_present = False
+    for aid in res.get("articleids", []):
+        if aid.get("idtype") == "pmcid" and aid.get("value"):
+            pmcid_present = True
+            break
+    return journal_title, pub_year, first_author, pmcid_present
 
-    # --- ESummary: journal name, pub year, authors, pmcid presence
-    try:
-        r = requests.get(
-            f"{NCBI_EUTILS}/esummary.fcgi",
-            params={"db": "pubmed", "id": pmid, "retmode": "json", **tool_params},
-            headers=HEADERS, timeout=REQUEST_TIMEOUT,
-        )
-        r.raise_for_status()
-        res = r.json().get("result", {}).get(pmid, {})
-        journal_title = res.get("fulljournalname") or res.get("source") or ""
-        pubdate = (res.get("pubdate") or "").split(" ")[0]
-        try:
-            pub_year = int(pubdate[:4])
-        except Exception:
-            pub_year = None
-        auths = res.get("authors") or []
-        if auths:
-            # Use "LastName Initials" if present
-            ln = (auths[0].get("lastname") or "").strip()
-            ini = (auths[0].get("initials") or "").strip()
-            if ln:
-                first_author = f'{ln} {ini}'.strip()
-        # PMCID check
-        for aid in res.get("articleids", []):
-            if aid.get("idtype") == "pmcid" and aid.get("value"):
-                pmcid_present = True
-                break
-    except Exception:
-        pass
-
-    # --- Citations: ELink citedin count
-    citations = 0
-    try:
-        r = requests.get(
-            f"{NCBI_EUTILS}/elink.fcgi",
-            params={"dbfrom": "pubmed", "linkname": "pubmed_pubmed_citedin", "id": pmid, "retmode": "json", **tool_params},
-            headers=HEADERS, timeout=REQUEST_TIMEOUT,
-        )
-        r.raise_for_status()
-        linksets = r.json().get("linksets", []) or r.json().get("linkset", [])
-        # Both shapes exist in the wild; handle conservatively
-        uids = []
-        if isinstance(linksets, list) and linksets:
-            # New JSON shape
-            for ls in linksets:
-                for grp in ls.get("linksetdbs", []) or []:
-                    if grp.get("linkname") == "pubmed_pubmed_citedin":
-                        uids.extend(grp.get("links", []))
-        if not uids and "linksets" not in r.json():
-            # Legacy shape
-            for grp in r.json().get("linkset", [{}])[0].get("linksetdbs", []):
-                if grp.get("linkname") == "pubmed_pubmed_citedin":
-                    uids.extend([lk.get("id") for lk in grp.get("links", []) if isinstance(lk, dict)])
-        citations = len(uids)
-    except Exception:
-        citations = 0
 
-    # --- Journal Activity (articles in last 5 years)
-    journal_activity = 0
+def _activity_terms(journal_title: str, pub_year: Optional[int], first_author: Optional[str]) -> Tuple[str, str]:
+    """ESearch terms for journal activity (last 5 years) and first-author activity; "" when unknown."""
+    journal_term = ""
     if journal_title:
-        try:
-            from_year = max((pub_year or 2020) - 4, 1900)
-            to_year = (pub_year or 2025)
-            term = f'"{journal_title}"[ta] AND ("{from_year}"[dp] : "{to_year}"[dp])'
-            r = requests.get(
-                f"{NCBI_EUTILS}/esearch.fcgi",
-                params={"db": "pubmed", "term": term, "retmode": "json", "rettype": "count", **tool_params},
-                headers=HEADERS, timeout=REQUEST_TIMEOUT,
-            )
-            r.raise_for_status()
-            journal_activity = int(r.json().get("esearchresult", {}).get("count", "0"))
-        except Exception:
-            journal_activity = 0
+        from_year = max((pub_year or 2020) - 4, 1900)
+        to_year = (pub_year or 2025)
+        journal_term = f'"{journal_title}"[ta] AND ("{from_year}"[dp] : "{to_year}"[dp])'
+    author_term = f'"{first_author}"[au]' if first_author else ""
+    return journal_term, author_term
 
-    # --- Author Activity (rough pub count for first author)
-    author_pubs = 0
-    if first_author:
-        try:
-            term = f'"{first_author}"[au]'
-            r = requests.get(
-                f"{NCBI_EUTILS}/esearch.fcgi",
-                params={"db": "pubmed", "term": term, "retmode": "json", "rettype": "count", **tool_params},
-                headers=HEADERS, timeout=REQUEST_TIMEOUT,
-            )
-            r.raise_for_status()
-            author_pubs = int(r.json().get("esearchresult", {}).get("count", "0"))
-        except Exception:
-            author_pubs = 0
 
+def _linkset_source(ls: dict) -> Optional[str]:
+    ids = ls.get("ids") or []
+    if not ids:
+        return None
+    src = ids[0].get("id") if isinstance(ids[0], dict) else ids[0]
+    return str(src) if src else None
+
+
+def _reputation_score(
+    journal_title: str,
+    pub_year: Optional[int],
+    pmcid_present: bool,
+    citations: int,
+    journal_activity: int,
+    author_pubs: int,
+) -> dict:
     # --- Convert raw values to 0–100 scores (simple, explainable scalings)
-    def scale_cap_linear(x, cap):
-        x = max(0, int(x))
-        return min(100, int(round((min(x, cap) / cap) * 100)))
-
-    citations_score = scale_cap_linear(citations, cap=200)          # 200+ ≈ 100
+    citations_score = _scale_cap_linear(citations, cap=200)         # 200+ ≈ 100
     open_access_score = 100 if pmcid_present else 30                # OA strong signal
     # Recency: if no pubyear, neutral 60
     if pub_year:
@@ -740,8 +690,8 @@ def api_reputation(pmid: str):
     else:
         recency_score = 60
 
-    journal_activity_score = scale_cap_linear(journal_activity, cap=2000)  # very active journals approach 100
-    author_activity_score = scale_cap_linear(author_pubs, cap=200)         # prolific author approaches 100
+    journal_activity_score = _scale_cap_linear(journal_activity, cap=2000)  # very active journals approach 100
+    author_activity_score = _scale_cap_linear(author_pubs, cap=200)         # prolific author approaches 100
 
     components = {
         "Journal Activity": journal_activity_score,
@@ -768,86 +718,138 @@ def api_reputation(pmid: str):
         },
     }
 
-    # OpenAlex: work info
-    oa_work = _openalex_work_by_doi(doi) if doi else {}
-    cited_by = oa_work.get("cited_by_count") or 0
-    is_oa = bool((oa_work.get("open_access") or {}).get("is_oa"))
-    pub_year = oa_work.get("publication_year") or year
 
-    # Basic components
-    citations_score = _scale(float(cited_by), lo=0, hi=200)           # 200+ cites ~100
-    recency_score = 50
-    if pub_year:
-        # 0 yrs old ~100, 10+ yrs ~20
-        age = max(0, (2025 - int(pub_year)))
-        recency_score = max(20, 100 - age * 8)
-
-    oa_score = 100 if is_oa else 40
-
-    # Venue-level signal (h-index / mean citedness if available)
-    venue = _openalex_venue_by_issn_or_name(issn, journal_name)
-    venue_h = ((venue.get("summary_stats") or {}).get("h_index")) if venue else None
-    venue_citedness = ((venue.get("summary_stats") or {}).get("2yr_mean_citedness")) if venue else None
-
-    # Journal impact proxy combines venue stats if present; otherwise lean on citations.
-    impact_base = 0
-    if isinstance(venue_h, (int, float)):
-        impact_base += _scale(float(venue_h), lo=5, hi=200) * 0.6
-    if isinstance(venue_citedness, (int, float, str)):
-        try:
-            v = float(venue_citedness)
-            impact_base += _scale(v, lo=0.5, hi=6.0) * 0.4
-        except Exception:
-            pass
-    if impact_base == 0:
-        # Fallback: use article citations as a soft journal proxy
-        impact_base = max(30, citations_score * 0.9)
-    journal_impact_score = int(round(min(100, impact_base)))
-
-    # Author h-index: average of up to first 3 authors (OpenAlex authorships)
-    h_scores: List[int] = []
-    for auth in (oa_work.get("authorships") or [])[:3]:
-        auth_id = (auth.get("author") or {}).get("id")
-        if not auth_id:
-            continue
-        try:
-            r = requests.get(auth_id, headers=HEADERS, timeout=REQUEST_TIMEOUT)
-            if r.status_code == 200:
-                h = (r.json().get("summary_stats") or {}).get("h_index")
-                if isinstance(h, (int, float)):
-                    h_scores.append(_scale(float(h), lo=5, hi=120))
-        except Exception:
-            continue
-    author_hidx_score = int(round(sum(h_scores) / len(h_scores))) if h_scores else 55
+async def _fetch_reputations(pmids: List[str]) -> Tuple[Dict[str, dict], Set[str]]:
+    """
+    Reputation for a batch of PMIDs. ESummary takes a comma-joined id list and ELink
+    takes repeated id= params (one linkset per input), so the batch costs one call of
+    each plus one ESearch count per distinct journal/author term.
 
-    # Compose components and overall
-    components = {
-        "Journal Impact": journal_impact_score,
-        "Citations": citations_score,
-        "Open Access": oa_score,
-        "Recency": recency_score,
-        "Author H-index": author_hidx_score,
-    }
-    total = int(round(sum(components.values()) / len(components)))
-    level = "Low" if total < 40 else ("Medium" if total < 60 else ("High" if total < 80 else "Very High"))
+    Also returns the PMIDs whose every upstream call succeeded (safe to cache).
+    """
+    async def fetch_esummary() -> dict:
+        r = await _ncbi_get(
+            f"{NCBI_EUTILS}/esummary.fcgi",
+            params={"db": "pubmed", "id": ",".join(pmids), "retmode": "json"},
+        )
+        r.raise_for_status()
+        return r.json().get("result", {})
 
-    # Extra surface fields
-    pmcid = None
-    for aid in (esum.get("articleids") or []):
-        if aid.get("idtype") == "pmcid":
-            pmcid = aid.get("value")
-            break
+    async def fetch_citations() -> Dict[str, int]:
+        r = await _ncbi_get(
+            f"{NCBI_EUTILS}/elink.fcgi",
+            params={"dbfrom": "pubmed", "linkname": "pubmed_pubmed_citedin", "id": pmids, "retmode": "json"},
+        )
+        r.raise_for_status()
+        payload = r.json()
+        linksets = payload.get("linksets") or payload.get("linkset") or []
+        # Both shapes exist in the wild (links as plain ids or as {"id": …}); count either.
+        counts: Dict[str, int] = {}
+        for ls in linksets if isinstance(linksets, list) else []:
+            src = _linkset_source(ls)
+            if not src:
+                continue
+            for grp in ls.get("linksetdbs", []) or []:
+                if grp.get("linkname") == "pubmed_pubmed_citedin":
+                    counts[src] = counts.get(src, 0) + len(grp.get("links", []) or [])
+        return counts
 
-    return {
-        "pmcid": pmcid,
-        "doi": doi,
-        "journal": journal_name or (oa_work.get("host_venue") or {}).get("display_name"),
-        "year": pub_year,
-        "total": total,
-        "level": level,
-        "confidence": 85,  # static confidence for this proxy; not a statistical measure
-        "components": components,
-    }
+    async def fetch_count(term: str) -> int:
+        r = await _ncbi_get(
+            f"{NCBI_EUTILS}/esearch.fcgi",
+            params={"db": "pubmed", "term": term, "retmode": "json", "rettype": "count"},
+        )
+        r.raise_for_status()
+        return int(r.json().get("esearchresult", {}).get("count", "0"))
+
+    # --- ESummary and ELink citedin run side by side; one failing must not cancel the other.
+    summaries, citations = await asyncio.gather(fetch_esummary(), fetch_citations(), return_exceptions=True)
+    citations_ok = not isinstance(citations, BaseException)
+    if isinstance(summaries, BaseException):
+        summaries = {}
+    if not citations_ok:
+        citations = {}
+
+    fields = {p: _reputation_fields(summaries.get(p) or {}) for p in pmids}
+    terms = {p: _activity_terms(jt, year, author) for p, (jt, year, author, _) in fields.items()}
+
+    # --- Journal / Author Activity: one count per distinct term, all in parallel.
+    unique_terms = list(dict.fromkeys(t for pair in terms.values() for t in pair if t))
+    counts = await asyncio.gather(*[fetch_count(t) for t in unique_terms], return_exceptions=True)
+    count_by_term = {t: (0 if isinstance(c, BaseException) else c) for t, c in zip(unique_terms, counts)}
+    failed_terms = {t for t, c in zip(unique_terms, counts) if isinstance(c, BaseException)}
+
+    out: Dict[str, dict] = {}
+    complete: Set[str] = set()
+    for p in pmids:
+        record = summaries.get(p) or {}
+        # ESummary reports unknown ids as {"uid": …, "error": …} rather than omitting them.
+        if citations_ok and record and "error" not in record and not failed_terms.intersection(terms[p]):
+            complete.add(p)
+        journal_title, pub_year, _, pmcid_present = fields[p]
+        journal_term, author_term = terms[p]
+        out[p] = _reputation_score(
+            journal_title, pub_year, pmcid_present,
+            citations=citations.get(p, 0),
+            journal_activity=count_by_term.get(journal_term, 0),
+            author_pubs=count_by_term.get(author_term, 0),
+        )
+    return out, complete
+
+
+async def _reputation_bulk(pmids: List[str]) -> Tuple[Dict[str, dict], Set[str]]:
+    """Cached front for _fetch_reputations: only PMIDs missing from the cache hit NCBI,
+    and only complete results are stored. Returns (results, PMIDs with complete results)."""
+    out: Dict[str, dict] = {}
+    complete: Set[str] = set()
+    misses: List[str] = []
+    for p in pmids:
+        hit = _REPUTATION_CACHE.get(p)
+        if hit is None:
+            misses.append(p)
+        else:
+            out[p] = hit
+            complete.add(p)
+    if misses:
+        fetched, fetched_complete = await _fetch_reputations(misses)
+        out.update(fetched)
+        complete |= fetched_complete
+        for p in fetched_complete:
+            _REPUTATION_CACHE[p] = fetched[p]
+    return {p: out[p] for p in pmids}, complete
+
+
+@app.post("/api/reputation_bulk")
+async def api_reputation_bulk(payload: Dict = Body(...)):
+    """Reputation for several PMIDs at once ({"pmids": [...]}); same shape per PMID as /api/reputation."""
+    pmids = payload.get("pmids")
+    if not isinstance(pmids, list) or not all(isinstance(p, str) and _PMID_RE.fullmatch(p) for p in pmids):
+        raise HTTPException(status_code=422, detail="pmids must be a list of numeric PMID strings")
+    pmids = list(dict.fromkeys(pmids))
+    if len(pmids) > REPUTATION_BULK_MAX:
+        raise HTTPException(status_code=422, detail=f"at most {REPUTATION_BULK_MAX} pmids per request")
+    if not pmids:
+        return {"results": {}}
+    results, _ = await _reputation_bulk(pmids)
+    return {"results": results}
+
+
+@app.get("/api/reputation/{pmid}")
+async def api_reputation(pmid: str, response: Response):
+    """
+    Practical 'reputation' based on data we can obtain from PubMed:
+    - Citations: count of PubMed papers that cite this PMID (ELink citedin)
+    - Open Access: PMCID presence (100 if present else 30)
+    - Recency: years since publication -> decays with time
+    - Journal Activity: articles published by this journal in the last 5 years
+    - Author Activity: rough publication count for the first author
+
+    Returns components + total + level.
+    """
+    results, complete = await _reputation_bulk([pmid])
+    if pmid in complete:
+        response.headers["Cache-Control"] = CACHE_CONTROL
+    return results[pmid]
 
 
 # ------------------------------------------------------------------------------
@@ -856,4 +858,13 @@ def api_reputation(pmid: str):
 
 @app.exception_handler(Exception)
 async def all_errors(_, exc):
-    return JSONResponse(status_code=500, content={"error": str(exc)})
+    # Details go to the log, not the client; formatting str(exc) can be costly and leaks internals.
+    logger.error("unhandled error", exc_info=exc)
+    return ORJSONResponse(status_code=500, content={"error": "internal error"})
+
+
+# ------------------------------------------------------------------------------
+# Root (index.html); mounted last so the API routes above take precedence
+# ------------------------------------------------------------------------------
+
+app.mount("/", StaticFiles(directory=STATIC_DIR, html=True), name="root")